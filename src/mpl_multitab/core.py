@@ -4,19 +4,23 @@ tabbed window manager allowing easy navigation between many active figures.
 """
 
 # std
-import sys
+import os
+import gc
 import numbers
+import weakref
 import itertools as itt
+import functools as ftl
 import contextlib as ctx
 from pathlib import Path
-from collections import abc
+from collections import abc, deque
 
 # third-party
 from loguru import logger
 from matplotlib import use
 from matplotlib.figure import Figure
-from matplotlib.backends.qt_compat import QtCore, QtWidgets
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib._pylab_helpers import Gcf
+from matplotlib.backends.qt_compat import QT_API, QtCore, QtGui, QtWidgets
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
 from matplotlib.backends.backend_qt import (
     NavigationToolbar2QT as NavigationToolbar)
 
@@ -25,9 +29,6 @@ from ._logging import LoggingMixin
 
 
 # ---------------------------------------------------------------------------- #
-use('QTAgg')
-
-
 TAB_POS = {
     'N': QtWidgets.QTabWidget.North,
     'W': QtWidgets.QTabWidget.West,
@@ -39,26 +40,57 @@ TAB_POS = {
 
 
 def is_template_string(s):
-    if not isinstance(s, str):
-        return False
+    # NOTE: this is a fairly weak test, but hopefully no one actually wants
+    # curly braces in a actualy file name
+    return isinstance(s, str) and '{' in s and '}' in s
+
+
+@ftl.lru_cache()
+def _ensure_backend():
+    # Select the Qt backend the first time a figure is embedded rather than at
+    # import, so importing this package does not switch the pyplot backend.
+    use('QTAgg')
+
+
+def _savefig(figure, filename, kws):
+    # module level so that it can be dispatched to worker processes
+    logger.debug('Saving figure: {}', filename)
+    figure.savefig(filename, **kws)
 
-    if '{' in s:
-        # NOTE: this is a fairly weak test, but hopefully no one actually wants
-        # curly braces in a actualy file name
-        return True
 
-    raise ValueError('Not a valid template string. Expected format string '
-                     'syntax (curly braces).')
+def _singlecore():
+    # boolean environment switch for disabling parallel saving
+    flag = os.environ.get('MPL_MULTITAB_SINGLECORE', '').strip().lower()
+    return flag not in ('', '0', 'false', 'no', 'off')
 
 
-def depth(obj, _depth=0):
-    if isinstance(obj, abc.MutableMapping):
-        return max((_depth, *(depth(v, _depth + 1) for v in obj.values())))
+@ctx.contextmanager
+def signals_blocked(widget):
+    # temporarily suppress signals emitted by a Qt object
+    previous = widget.blockSignals(True)
+    try:
+        yield widget
+    finally:
+        widget.blockSignals(previous)
 
-    elif isinstance(obj, abc.Sequence):
-        return 1
 
-    return _depth
+def depth(obj, limit=None):
+    # Nesting depth of mappings in `obj`. If `limit` is given, return as soon
+    # as any branch reaches that depth.
+    result = 0
+    stack = [(obj, 0)]
+    while stack:
+        obj, level = stack.pop()
+        if isinstance(obj, abc.MutableMapping):
+            stack.extend((v, level + 1) for v in obj.values())
+        elif isinstance(obj, abc.Sequence):
+            level = 1
+
+        result = max(result, level)
+        if limit and result >= limit:
+            break
+
+    return result
 
 # ---------------------------------------------------------------------------- #
 
@@ -70,7 +102,7 @@ class TabNode(QtWidgets.QWidget, LoggingMixin):
     def __repr__(self):
         pre = index = ''
         level = f'{self._level()}/{self._root()._height()}'
-        if parent := self._parent():
+        if (parent := self._parent()) is not None:
             index = parent.tabs.indexOf(self)
             pre = f'{parent.tabs.tabText(index)!r}, {index=}, '
 
@@ -120,15 +152,20 @@ class TabNode(QtWidgets.QWidget, LoggingMixin):
         yield from self.values()
 
     def _descendants(self):
-        for child in self._children():
-            yield child
-            yield from child._descendants()
+        # iterative breadth-first traversal (no recursion limit on deep trees)
+        queue = deque(self._children())
+        while queue:
+            node = queue.popleft()
+            yield node
+            queue.extend(node._children())
 
     # alias
     _descendents = _descendants
 
     def _siblings(self):
-        return tuple(set(parent) - {self}) if (parent := self._parent()) else ()
+        if (parent := self._parent()) is not None:
+            return tuple(set(parent) - {self})
+        return ()
 
     def _parent(self):
         if parent := self.parent():
@@ -138,12 +175,12 @@ class TabNode(QtWidgets.QWidget, LoggingMixin):
 
     def _ancestors(self):
         manager = self
-        while parent := manager._parent():
+        while (parent := manager._parent()) is not None:
             yield parent
             manager = parent
 
     def _root(self):
-        if self._parent():
+        if self._parent() is not None:
             *_, root = self._ancestors()
             return root
         return self
@@ -183,7 +220,9 @@ class TabNode(QtWidgets.QWidget, LoggingMixin):
             yield node
 
     def _is_active(self):
-        return (parent._active_tab() is self) if (parent := self._parent()) else True
+        if (parent := self._parent()) is not None:
+            return parent._active_tab() is self
+        return True
 
     # ------------------------------------------------------------------------ #
     def _current_indices(self):
@@ -218,30 +257,159 @@ class PlotTask:
         return self.func(figure, key, *self.args, *args, **{**self.kws, **kws})
 
 
+class FigureCanvas(FigureCanvasQTAgg):
+    """
+    Qt Agg canvas that paints damaged regions straight from the Agg buffer.
+    """
+
+    def paintEvent(self, event):
+        # Unlike the base class, which first copies the damaged region out of
+        # the renderer with `copy_from_bbox`, wrap the whole Agg buffer in a
+        # QImage (zero-copy) and let the painter blit only the damaged rect.
+        self._draw_idle()  # Only does something if a draw is pending.
+
+        # no renderer until the first draw
+        if not hasattr(self, 'renderer'):
+            return
+
+        # keep a reference to `buf` while `qimage` is in use
+        buf = self.buffer_rgba()
+        height, width, _ = buf.shape
+        if QT_API == 'PyQt6':
+            from PyQt6 import sip
+            ptr = int(sip.voidptr(buf))
+        else:
+            ptr = buf
+
+        qimage = QtGui.QImage(ptr, width, height,
+                              QtGui.QImage.Format.Format_RGBA8888)
+        qimage.setDevicePixelRatio(ratio := self.device_pixel_ratio)
+
+        painter = QtGui.QPainter(self)
+        try:
+            rect = event.rect()
+            source = QtCore.QRectF(rect.left() * ratio, rect.top() * ratio,
+                                   rect.width() * ratio, rect.height() * ratio)
+            painter.eraseRect(rect)  # clear the widget canvas
+            painter.drawImage(QtCore.QRectF(rect), qimage, source)
+            self._draw_rect_callback(painter)
+        finally:
+            painter.end()
+
+
+class SharedNavigationToolbar(NavigationToolbar):
+    """
+    Navigation toolbar that can be re-targeted between canvases, so that a
+    single toolbar can serve all the figures in a tab manager.
+    """
+
+    def __init__(self, canvas, parent=None, coordinates=True):
+        # navigation history for canvases this toolbar is not currently on
+        self._nav_stacks = weakref.WeakKeyDictionary()
+        super().__init__(canvas, parent, coordinates)
+
+    def set_canvas(self, canvas):
+        """
+        Point the toolbar at a different canvas. Navigation history is kept
+        per canvas, and an active pan/zoom mode carries over.
+        """
+        if canvas is (old := self.canvas):
+            return
+
+        # detach from previous canvas
+        for cid in (self._id_press, self._id_release, self._id_drag):
+            old.mpl_disconnect(cid)
+
+        if locked := old.widgetlock.isowner(self):
+            old.widgetlock.release(self)
+
+        old.toolbar = None
+        self._nav_stacks[old] = self._nav_stack
+
+        # attach to new canvas
+        self.canvas = canvas
+        canvas.toolbar = self
+        if (stack := self._nav_stacks.pop(canvas, None)) is None:
+            stack = type(self._nav_stack)()
+        self._nav_stack = stack
+
+        self._id_press = canvas.mpl_connect(
+            'button_press_event', self._zoom_pan_handler)
+        self._id_release = canvas.mpl_connect(
+            'button_release_event', self._zoom_pan_handler)
+        self._id_drag = canvas.mpl_connect(
+            'motion_notify_event', self.mouse_move)
+
+        if locked:
+            canvas.widgetlock(self)
+
+        # subplot dialog is tied to the previous figure
+        self._subplot_dialog = None
+        self._pan_info = self._zoom_info = None
+        self.set_message('')
+        self.set_history_buttons()
+
+
 class MplTabbedFigure(TabNode):
 
     plot = None
 
     def __init__(self, figure, parent=None):
         QtWidgets.QWidget.__init__(self, parent)
+        _ensure_backend()
 
-        # initialise FigureCanvas
+        # FigureCanvas is created lazily when first needed. The navigation
+        # toolbar is shared between all figures in the tab tree.
         self.figure = figure
-        self.canvas = canvas = FigureCanvas(figure)
-        canvas.setParent(self)
-        canvas.setFocusPolicy(QtCore.Qt.StrongFocus)
-
-        # Create the navigation toolbar
-        navtool = NavigationToolbar(canvas, self)
+        self._canvas = None
+        self.toolbar = None
 
         self.vbox = QtWidgets.QVBoxLayout()
-        self.vbox.addWidget(navtool)
-        self.vbox.addWidget(canvas)
         self.setLayout(self.vbox)
 
         self._drawn = False
         self._connection_draw0 = None
 
+        # blitting support for animated artists, set up on first use
+        self._connection_background = None
+        self._background = None
+        self._animated = []
+
+    @property
+    def canvas(self):
+        if self._canvas is None:
+            self._build_canvas()
+        return self._canvas
+
+    def _build_canvas(self):
+        self.logger.debug('Creating canvas for {}.', self)
+
+        # initialise FigureCanvas
+        self._canvas = canvas = FigureCanvas(self.figure)
+        canvas.setParent(self)
+        canvas.setFocusPolicy(QtCore.Qt.StrongFocus)
+        self.vbox.addWidget(canvas)
+
+    def sizeHint(self):
+        # reserve space for the canvas before it is created
+        if self._canvas is None:
+            return QtCore.QSize(*map(int, self.figure.bbox.size))
+        return super().sizeHint()
+
+    def showEvent(self, event):
+        # build the canvas the first time this tab is displayed
+        if self._canvas is None:
+            self._build_canvas()
+
+        # borrow the navigation toolbar from the root manager
+        if self._parent() is not None:
+            self._root()._attach_toolbar(self)
+        elif self.toolbar is None:
+            self.toolbar = NavigationToolbar(self.canvas, self)
+            self.vbox.insertWidget(0, self.toolbar)
+
+        super().showEvent(event)
+
     def add_task(self, func, *args, **kws):
         # connect plot callback
         if func and not callable(func):
@@ -282,6 +450,48 @@ class MplTabbedFigure(TabNode):
         self.canvas.mpl_disconnect(self._connection_draw0)
         logger.debug('Disconnected first draw action.')
 
+    def _save_background(self, event):
+        # Full draws exclude animated artists. If there are any, cache the
+        # background and draw them on top, see matplotlib's blitting tutorial.
+        self._animated = self.figure.findobj(lambda artist: artist.get_animated())
+        if not self._animated:
+            self._background = None
+            return
+
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_animated(self._animated)
+
+    def _draw_animated(self, artists):
+        for artist in artists:
+            self.figure.draw_artist(artist)
+
+    def redraw_animated(self, artists=None):
+        """
+        Redraw animated artists by blitting them onto the cached background,
+        avoiding a full re-render of the figure. The first call schedules a
+        full draw that caches the background, blitting starts after that.
+
+        Parameters
+        ----------
+        artists : list of matplotlib.artist.Artist, optional
+            Artists to redraw, by default all animated artists in the figure.
+        """
+        if self._connection_background is None:
+            # cache the background after each full draw from now on
+            self._connection_background = self.canvas.mpl_connect(
+                'draw_event', self._save_background)
+
+        if self._background is None:
+            # no full draw yet, nothing to blit onto. The full draw will also
+            # draw the animated artists, coalesce it with any pending redraw
+            self.canvas.draw_idle()
+            return
+
+        canvas = self.canvas
+        canvas.restore_region(self._background)
+        self._draw_animated(self._animated if artists is None else artists)
+        canvas.blit(self.figure.bbox)
+
 
 class TabManager(TabNode):
 
@@ -298,20 +508,36 @@ class TabManager(TabNode):
         self._previous = -1
         #
         self._index0 = 0
+        self._toolbar = None
         self.pos = pos.upper()
         self._layout(pos)
 
         # resolve figures
         if isinstance(figures, abc.Sequence):
-            items = itt.zip_longest((), figures)
+            template = self._tab_name_template
+            items = ((template.format(i), fig) for i, fig in enumerate(figures, 1))
+        elif isinstance(figures, abc.Mapping):
+            items = figures.items()
         else:
             items = dict(figures or {}).items()
 
-        # add tabs
-        for name, fig in items:
-            self.add_tab(name, fig=fig)
+        # add tabs, focussing the first one only once all are in place
+        with signals_blocked(self.tabs):
+            for name, fig in items:
+                self.add_tab(name, fig=fig)
+
+        if len(self):
+            self.tabs.setCurrentIndex(self._index0)
+
+    @classmethod
+    def _make_manager(cls, figures=(), *args, **kws):
+        # factory hook for choosing the manager class based on `figures`
+        return cls(figures, *args, **kws)
 
     def _layout(self, pos):
+        # tab position
+        self.tabs.setTabPosition(TAB_POS[pos])
+
         # layout
         layout = QtWidgets.QVBoxLayout()
         layout.addWidget(self.tabs)
@@ -320,16 +546,31 @@ class TabManager(TabNode):
         layout.setSpacing(0)
         self.setLayout(layout)
 
-        # tab position
-        self.tabs.setTabPosition(TAB_POS[pos])
-
         # if pos == 'W':
         #     space_tab = self._insert_spacer()
 
+    def _attach_toolbar(self, tab):
+        # move the single navigation toolbar onto the displayed figure tab
+        toolbar = self._toolbar
+        if toolbar is None:
+            self.logger.debug('Creating shared navigation toolbar for {}.', self)
+            self._toolbar = toolbar = SharedNavigationToolbar(tab.canvas, tab)
+        else:
+            toolbar.set_canvas(tab.canvas)
+
+        if (previous := toolbar.parentWidget()) is not tab:
+            previous.vbox.removeWidget(toolbar)
+            previous.toolbar = None
+
+        if tab.toolbar is not toolbar:
+            tab.vbox.insertWidget(0, toolbar)
+            tab.toolbar = toolbar
+            toolbar.show()
+
     def _insert_spacer(self):
         # add inactive spacer tab
         self.logger.debug('Adding inactive spacer tab.')
-        space_tab = QtWidgets.QTabWidget(self)
+        space_tab = QtWidgets.QWidget(self)
         space_tab.setVisible(False)
         space_tab.setEnabled(False)
         self.tabs.addTab(space_tab, ' ')
@@ -354,15 +595,22 @@ class TabManager(TabNode):
         self.add_tab(tab_name, fig=figure)
 
     def __delitem__(self, key):
-        self.tabs.removeTab(self._resolve_index(key))
+        self.remove_tab(key)
 
     def keys(self):
-        for i in range(self._index0, self.tabs.count()):
-            yield self.tabs.tabText(i)
+        yield from self._tab_texts()
+
+    def _tab_texts(self):
+        # read all tab names from the tab bar in one go (excluding spacer)
+        bar = self.tabs.tabBar()
+        return [bar.tabText(i) for i in range(self._index0, bar.count())]
 
     def values(self):
         for i in range(self._index0, self.tabs.count()):
-            yield self.tabs.widget(i)
+            # While a tab is being removed, the tab bar still counts it but the
+            # widget is gone. The next tab may be shown in the meantime.
+            if (widget := self.tabs.widget(i)) is not None:
+                yield widget
 
     # ------------------------------------------------------------------------ #
     def _is_uniform(self):
@@ -376,7 +624,7 @@ class TabManager(TabNode):
 
     def _resolve_index(self, key):
         if isinstance(key, str):
-            for i, trial in enumerate(self.keys(), self._index0):
+            for i, trial in enumerate(self._tab_texts(), self._index0):
                 if key == trial:
                     return i
 
@@ -441,12 +689,14 @@ class TabManager(TabNode):
         if isinstance(fig, abc.MutableMapping):
             fig = Figure(**fig, **kws)
 
-        fig = fig or Figure(**kws)
+        if fig is None:
+            fig = Figure(**kws)
+
         assert isinstance(fig, Figure)
 
-        # if pyplot gui is active, make it close the figure
-        if plt := sys.modules.get('matplotlib.pyplot'):
-            plt.close(fig)
+        # if the figure is managed by pyplot, release it. This is what
+        # `plt.close(fig)` does, without needing pyplot to be imported
+        Gcf.destroy_fig(fig)
 
         # convert to str required by pyside
         return str(name), MplTabbedFigure(fig, parent=self)
@@ -475,7 +725,28 @@ class TabManager(TabNode):
             self.tabs.setCurrentIndex(index)
 
     def remove_tab(self, key):
-        return self.tabs.removeTab(self.tabs.indexOf(self._resolve_index(key)))
+        return self.tabs.removeTab(self._resolve_index(key))
+
+    def close_tab(self, key):
+        """
+        Remove a tab and free the memory held by the figure(s) it contains.
+        """
+        tab = self[key]
+        self.remove_tab(key)
+
+        nodes = (tab, *tab._descendants())
+        for node in nodes:
+            if isinstance(node, MplTabbedFigure):
+                node.figure.clear()
+
+        # the shared toolbar is deleted along with the tab hosting it, the
+        # next tab shown creates a new one
+        root = self._root()
+        if ((toolbar := root._toolbar) is not None
+                and toolbar.parentWidget() in nodes):
+            root._toolbar = None
+
+        tab.deleteLater()
 
     def replace_tab(self, key, fig, focus=False, **kws):
 
@@ -526,6 +797,14 @@ class TabManager(TabNode):
         # update previous
         self._previous = index
 
+        # fast path: nothing to do for a figure without a plot task, or one
+        # that is already drawn and up to date
+        target = self.tabs.widget(index)
+        if not self._link_focus and (
+                not getattr(target, 'plot', None)
+                or (target._drawn and not target.figure.stale)):
+            return False
+
         # run any if needed
         return self.run_task(index - self._index0)
 
@@ -546,6 +825,10 @@ class TabManager(TabNode):
         if not fig._drawn:
             self.logger.debug('Drawing figure: {}.', names)
             fig.canvas.draw()
+        elif fig.figure.stale:
+            # draw_idle coalesces with any draw already requested by the task
+            self.logger.debug('Scheduling redraw for stale figure: {}.', names)
+            fig.canvas.draw_idle()
 
         return True
 
@@ -611,42 +894,81 @@ class TabManager(TabNode):
         return tuple(self._tab_text(indices))
 
     # ------------------------------------------------------------------------ #
-    def save(self, filenames=(), folder='', **kws):
+    def save(self, filenames=(), folder='', workers=1, **kws):
         """
+        Save the embedded figures to file.
 
         Parameters
         ----------
-        template
-        filenames
-        path
-
-        Returns
-        -------
-
+        filenames : str or Path or Sequence or Iterable or callable
+            Filenames for the figures. A format string template (or folder
+            path) is formatted with each tab's name.
+        folder : str or Path, optional
+            Folder for relative filenames, by default the current directory.
+        workers : int, optional
+            Number of processes to render figures with, by default 1 (serial).
+            Setting the environment variable `MPL_MULTITAB_SINGLECORE` to a
+            true value forces serial saving. Empty, "0", "false", "no" and
+            "off" (any case) count as false.
+        **kws
+            Keyword arguments passed to `Figure.savefig`.
         """
-        n = self.tabs.count()
-        if n == 1:
+        # snapshot tab names and widgets once to avoid repeated Qt calls
+        if not (names := tuple(self.keys())):
             logger.warning('No figures embedded yet, nothing to save!')
             return
 
-        folder = Path(folder)
-        for i, filename in enumerate(self._check_filenames(filenames)):
+        tabs = tuple(self.values())
+        # resolve once, relative filenames joined to this are absolute already
+        folder = Path(folder).resolve()
+        filenames = self._check_filenames(filenames, names)
+        jobs = []
+        for tab, filename in zip(tabs, filenames):
             if not (filename := Path(filename)).is_absolute():
                 filename = folder / filename
 
-            filename = filename.resolve()
-            logger.debug('Saving figure: {}')
-            self[i].figure.savefig(filename, **kws)
+            jobs.append((tab.figure, filename))
+
+        if (workers > 1 and len(jobs) > 1
+                and not _singlecore()):
+            self.logger.debug('Saving {} figures with {} workers.',
+                              len(jobs), workers)
+            # imported here since multiprocessing is slow to import and only
+            # needed for parallel saving
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(workers) as executor:
+                # consume to propagate errors from workers
+                list(executor.map(_savefig, *zip(*jobs), itt.repeat(kws)))
+        else:
+            for figure, filename in jobs:
+                _savefig(figure, filename, kws)
+
+        # rendering many figures leaves reference cycles (renderer caches,
+        # transforms) that are otherwise only freed much later
+        gc.collect()
 
     save_figures = save
 
-    def _check_filenames(self, filenames):
+    def _check_filenames(self, filenames, names=None):
 
         if isinstance(filenames, Path):
             filenames = str(filenames / '{}')
 
-        n = self.tabs.count()
-        if isinstance(filenames, abc.Sequence):
+        if names is None:
+            names = tuple(self.keys())
+
+        n = len(names)
+        if isinstance(filenames, str):
+            if not is_template_string(filenames):
+                raise ValueError('Not a valid template string. Expected format '
+                                 'string syntax (curly braces).')
+
+            self.logger.debug('Saving {} figures with filename template: {!r}.',
+                              n, filenames)
+            filenames = filenames.format
+
+        elif isinstance(filenames, abc.Sequence):
             if (m := len(filenames)) != n:
                 raise ValueError(
                     f'Incorrect number of filenames {m}. There are {n} figure '
@@ -658,17 +980,12 @@ class TabManager(TabNode):
 
             return filenames
 
-        if isinstance(filenames, abc.Iterable):
+        elif isinstance(filenames, abc.Iterable):
             return filenames
 
-        if is_template_string(filenames):
-            self.logger.debug('Saving {} figures with filename template: {!r}.',
-                              n, filenames)
-            filenames = filenames.format
-
         if callable(filenames):
             # partial format string with dataset name
-            return ((filenames(self.tabs.tabText(i))) for i in range(n))
+            return (filenames(name) for name in names)
 
         raise TypeError(f'Invalid filenames: {filenames!r}')
 
@@ -679,12 +996,11 @@ class NestedTabsManager(TabManager):
     _tab_name_template = 'Group {}'
     _factory_kws = {}
 
-    def __new__(cls, figures, *args, **kws):
+    @classmethod
+    def _make_manager(cls, figures=(), *args, **kws):
         # catch for figures being 1d sequence or mapping, use plain TabManager
-        if figures and depth(figures) == 1:
-            return TabManager(figures)
-
-        return super().__new__(cls)
+        kls = TabManager if (figures and depth(figures, 2) == 1) else cls
+        return kls(figures, *args, **kws)
 
     def __init__(self, figures=(), pos='N', parent=None):
 
@@ -696,9 +1012,15 @@ class NestedTabsManager(TabManager):
 
         # tabs switches the group being displayed in central panel which may
         # itself be NestedTabsManager or TabManager at lowest level
-        figures = dict(figures or ())
-        for name, figs in figures.items():
-            self.add_group(name, figs)
+        if not isinstance(figures, abc.Mapping):
+            figures = dict(figures or ())
+
+        with signals_blocked(self.tabs):
+            for name, figs in figures.items():
+                self.add_group(name, figs)
+
+        if len(self):
+            self.tabs.setCurrentIndex(self._index0)
 
         if self.plot:
             self.logger.debug('Detected figure initializer method {}. '
@@ -731,7 +1053,7 @@ class NestedTabsManager(TabManager):
 
         super()._add_tab(name, obj, pos, focus)
 
-    def add_tab(self, *keys, fig=(), position=-1, focus=None, **kws):
+    def add_tab(self, *keys, fig=None, position=-1, focus=None, **kws):
         """
         Add a (nested) tab.
         """
@@ -755,7 +1077,7 @@ class NestedTabsManager(TabManager):
         """
         Add a (nested) tab group.
         """
-        nested = type(self)(figures, parent=self)
+        nested = self._make_manager(figures, parent=self, **self._factory_kws)
         super()._add_tab(name,
                          nested,
                          position,
@@ -887,7 +1209,10 @@ class NestedTabsManager(TabManager):
         self.logger.debug('Co-focussing {!r} siblings to: {}.', self, indices)
 
         for mgr in self._inactive():
-            mgr.set_focus(*below)
+            # hidden siblings only need their index updated, don't fire their
+            # tab change callbacks
+            with signals_blocked(mgr.tabs):
+                mgr.set_focus(*below, force_callback=False)
 
     def link_focus(self, *indices):
         super().link_focus()
@@ -940,7 +1265,8 @@ class MplTabGUI(QtWidgets.QMainWindow, LoggingMixin):
         self.main_frame.setFocus()
         self.setCentralWidget(self.main_frame)
 
-        self.tabs = manager(figures, pos, parent=self.main_frame, **kws)
+        self.tabs = manager._make_manager(figures, pos, parent=self.main_frame,
+                                          **kws)
         self.tabs.tabs.setMovable(True)  # outer tabs movable
 
         layout = QtWidgets.QVBoxLayout()
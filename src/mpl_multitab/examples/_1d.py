@@ -13,6 +13,9 @@ sys.modules['matplotlib.pyplot'] = None
 
 COLOURS = 'rgb'
 
+# random number generator for example data
+rng = np.random.default_rng()
+
 # ---------------------------------------------------------------------------- #
 
 
@@ -23,7 +26,7 @@ def example_1d(n=100, colours=COLOURS):
     for c in colours:
         fig = ui.add_tab(c)
         ax = fig.subplots()
-        ax.scatter(*np.random.randn(2, n), color=c)
+        ax.scatter(*rng.standard_normal((2, n)), color=c)
 
     ui.set_focus(0)
     return ui
@@ -41,7 +44,7 @@ def example_delay_draw(n=10_000, colours=COLOURS):
         i, = indices
         print('Doing plot:', i)
         ax = fig.subplots()
-        return ax.scatter(*np.random.randn(2, n), color=colours[i])
+        return ax.scatter(*rng.standard_normal((2, n)), color=colours[i])
 
     ui.add_task(plot)   # add your plot worker
     ui.set_focus(0)         # this will trigger the plotting for group 0 tab 0
@@ -16,6 +16,9 @@ sys.modules['matplotlib.pyplot'] = None
 
 COLOURS = 'rgb'
 MARKERS = '123'
+
+# random number generator for example data
+rng = np.random.default_rng()
 # ---------------------------------------------------------------------------- #
 
 
@@ -28,7 +31,7 @@ def example_2d(n=100, colours=COLOURS, markers=MARKERS):
     for c, m in itt.product(colours, markers):
         fig = ui.add_tab(f'Dataset {c.upper()}', f'Observation {m}')
         ax = fig.subplots()
-        ax.scatter(*np.random.randn(2, n), color=c, marker=f'${m}$')
+        ax.scatter(*rng.standard_normal((2, n)), color=c, marker=f'${m}$')
 
     ui.set_focus(0, 0)
     ui.link_focus()
@@ -48,7 +51,7 @@ def example_delay_draw(n=10_000, colours=COLOURS, markers=MARKERS):
         print('Doing plot:', indices)
         i, j = indices
         ax = fig.subplots()
-        return ax.scatter(*np.random.randn(2, n),
+        return ax.scatter(*rng.standard_normal((2, n)),
                           color=colours[i],
                           marker=f'${markers[j]}$')
 
@@ -85,7 +88,7 @@ def example_delay_draw(n=10_000, colours=COLOURS, markers=MARKERS):
 #         print('Doing plot:', indices)
 #         i, j = indices
 #         ax = fig.subplots()
-#         return ax.scatter(*np.random.randn(2, n),
+#         return ax.scatter(*rng.standard_normal((2, n)),
 #                           color=self.colours[i],
 #                           marker=f'${self.markers[j]}$')
 
@@ -25,6 +25,9 @@ COLOURS = 'rgb'
 MARKERS = 'H*P'
 HATCH = ('xx', '**')
 
+# random number generator for example data
+rng = np.random.default_rng()
+
 # ---------------------------------------------------------------------------- #
 
 
@@ -37,7 +40,7 @@ def example_3d(n=10, colours=COLOURS, markers=MARKERS, hatch=HATCH):
         # "Alt+x"!
         fig = ui.add_tab(f'Colour &{c.upper()}', f'Marker &{m}', f'Hatch &{h}')
         ax = fig.subplots()
-        ax.scatter(*np.random.randn(2, n),
+        ax.scatter(*rng.standard_normal((2, n)),
                    s=750, marker=m, hatch=h,
                    edgecolor=c,  facecolor='none')
 
@@ -54,7 +57,7 @@ def example_figures_predefined(n=10, colours=COLOURS, markers=MARKERS, hatch=HAT
     for c, m, h in itt.product(colours, markers, hatch):
         fig = Figure()
         ax = fig.subplots()
-        ax.scatter(*np.random.randn(2, n),
+        ax.scatter(*rng.standard_normal((2, n)),
                    s=750, marker=m, hatch=h,
                    edgecolor=c,  facecolor='none')
         figures[f'Colour {c.upper()}'][f'Marker {m}'][f'Hatch {h}'] = fig
@@ -74,7 +77,7 @@ def example_delay_draw(n=10, colours=COLOURS, markers=MARKERS, hatch=HATCH):
         print('Doing plot:', indices)
         i, j, k = indices
         ax = fig.subplots()
-        return ax.scatter(*np.random.randn(2, n),
+        return ax.scatter(*rng.standard_normal((2, n)),
                           s=750, marker=markers[j], hatch=hatch[k],
                           edgecolor=colours[i],  facecolor='none')
 
@@ -1,35 +1,50 @@
 
 
 # std
+import pickle
 import operator as op
 import itertools as itt
-from collections import defaultdict
+import functools as ftl
+from concurrent import futures
 
 # third-party
 import pytest
 import numpy as np
 from loguru import logger
 from matplotlib.figure import Figure
+from matplotlib.backend_bases import DrawEvent
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from mpl_multitab import MplMultiTab, MplTabs, QtCore, examples
 
 # ---------------------------------------------------------------------------- #
 logger.enable('mpl_multitab')
 
 # ---------------------------------------------------------------------------- #
+# seeded so the test data are reproducible between runs
+_RNG = np.random.default_rng(0)
+
 FEATURES = dict(
     color='rgb',
     marker='hDP',
     hatch=('xx', '*')
 )
+# the tests don't look at the plots, keep the markers small and few so they
+# are cheap to render
 STYLE = dict(
-    s=1000,
+    s=10,
     facecolor='none'
 )
-STRUCT = {
-    1: (dict, ()),
-    2: (defaultdict, dict),
-    3: (defaultdict, lambda: defaultdict(dict))
-}
+
+
+def _pickle_template():
+    # Figure with a single axes. Unpickling a copy is cheaper than constructing
+    # the figure and axes anew
+    fig = Figure()
+    fig.subplots()
+    return pickle.dumps(fig)
+
+
+_TEMPLATE = _pickle_template()
 
 
 # ---------------------------------------------------------------------------- #
@@ -50,66 +65,93 @@ def get_example(level, name):
     #  getattr(examples, f'_{level}d').example_delay_draw()
 
 
-def generate_features(level):
+@ftl.lru_cache()
+def _features(level):
+    # computed once per level, shared between tests. Not to be mutated!
     features = dict(tuple(FEATURES.items())[:level])
-    for values in itt.product(*features.values()):
-        yield dict(zip(features.keys(), values))
+    return tuple(dict(zip(features.keys(), values))
+                 for values in itt.product(*features.values()))
 
 
-def generate_datasets(level, n=25):
-    for kws in generate_features(level):
-        yield kws, np.random.randn(2, n)
+def generate_features(level):
+    yield from _features(level)
+
+
+def generate_datasets(level, n=2):
+    # draw the data for all datasets in one go
+    features = list(generate_features(level))
+    data = _RNG.standard_normal((len(features), 2, n))
+    yield from zip(features, data)
 
 
 def create_figures(level):
-    kls, args = STRUCT[level]
-    figures = kls(args)
+    # nested dict of figures, one level per feature
+    figures = {}
     for kws, data in generate_datasets(level):
         struct = figures
         *values, leaf = kws.values()
         for v in values:
-            struct = struct[v]
+            struct = struct.setdefault(v, {})
 
-        struct[leaf] = fig = Figure()
-        ax = fig.subplots()
-        ax.scatter(*data, **kws, **STYLE)
+        struct[leaf] = fig = pickle.loads(_TEMPLATE)
+        fig.axes[0].scatter(*data, **kws, **STYLE)
 
     return figures
 
 
 # ---------------------------------------------------------------------------- #
 
-def _change_tab(qtbot, mgr, i):
-    # simulate tab change through mouse interaction
-    if i == mgr._current_index():
+def _change_tab(qtbot, mgr, i, click=False):
+    # change tab, optionally simulating mouse interaction
+    tabs = mgr.tabs
+    # index including possible spacer tab
+    if (index := i + mgr._index0) == tabs.currentIndex():
         return
 
-    logger.debug('Changing tab {} {}', mgr, i)
-    tabs = mgr.tabs
-    bar = tabs.tabBar()
-    with qtbot.waitSignal(tabs.currentChanged, timeout=1000):
+    if click:
+        bar = tabs.tabBar()
         qtbot.mouseClick(bar, QtCore.Qt.LeftButton,
-                         pos=bar.tabRect(i + mgr._index0).center())
+                         pos=bar.tabRect(index).center())
+    else:
+        tabs.setCurrentIndex(index)
+
+    assert tabs.currentIndex() == index
+
+
+def _odometer(shape):
+    # Step through all indices like an odometer (last axis fastest), yielding
+    # the outermost axis that changed along with the new indices
+    itr = np.ndindex(*shape)
+    previous = next(itr, ())
+    for indices in itr:
+        axis = next(i for i, (j, k) in enumerate(zip(previous, indices)) if j != k)
+        yield axis, indices
+        previous = indices
 
 
-def _test_cycle_tabs(qtbot, ui, check=lambda: ()):
+def _test_cycle_tabs(qtbot, ui, check=lambda: (), click=False):
     # cycle through the tabs, check figure draws
     *branch, _ = ui.tabs._active_branch()
-    shape = map(len, branch)
-    itr = itt.product(*map(range, shape))
-    start = next(itr)
+    shape = tuple(map(len, branch))
+    start = (0, ) * len(shape)
 
     # check figure (0, ...) already drawn
     with qtbot.waitActive(ui):
         check(ui, start)  # check canvas drawn before any tab change
 
+    # managers along the active branch
+    path = [mgr := ui.tabs]
+    for i in start:
+        path.append(mgr := mgr[i])
+
     # cycle through the tabs, check figure draws
-    for indices in itr:
-        mgr = ui.tabs
-        for i in indices:
-            # switch tab
-            _change_tab(qtbot, mgr, i)
-            mgr = mgr[i]
+    for axis, indices in _odometer(shape):
+        # only switch tabs from the level that changed downward
+        del path[axis + 1:]
+        mgr = path[axis]
+        for i in indices[axis:]:
+            _change_tab(qtbot, mgr, i, click)
+            path.append(mgr := mgr[i])
 
         # check canvas drawn
         check(ui, indices)
@@ -122,39 +164,71 @@ def check_indices(ui, indices):
     assert ui[indices]._index() == indices
 
 
-@pytest.mark.parametrize('level', range(1, 4))
-def test_figures_predefined(qtbot, level):
+@pytest.fixture(params=range(1, 4), ids=str)
+def figures(request):
+    # fresh figures for each test, since the ui attaches canvases to them
+    return create_figures(request.param)
+
+
+def test_figures_predefined(qtbot, figures):
     #
-    ui = MplMultiTab(create_figures(level))
+    ui = MplMultiTab(figures)
     ui.show()
 
     # register ui
     qtbot.addWidget(ui)
 
-    # test
-    _test_cycle_tabs(qtbot, ui, check_indices)
+    # test (through mouse clicks here, the other tests change tabs directly)
+    _test_cycle_tabs(qtbot, ui, check_indices, click=True)
 
 
 # ---------------------------------------------------------------------------- #
 # Test delayed plot
 
-def _plot(fig, indices, n=10):
+def _index_datasets(level):
+    # map tab indices to the data plotted in that tab
+    shape = tuple(map(len, FEATURES.values()))[:level]
+    return {indices: data for indices, (_, data)
+            in zip(np.ndindex(*shape), generate_datasets(level))}
+
+
+@pytest.fixture(scope='session')
+def datasets():
+    # drawn once, shared by all parametrizations of the delayed draw test
+    return {level: _index_datasets(level) for level in range(1, 4)}
+
+
+def _plot(fig, indices, datasets):
     kws = {key: vals[i] for i, (key, vals) in zip(indices, FEATURES.items())}
-    return fig.subplots().scatter(*np.random.randn(2, n), **kws, **STYLE)
+    return fig.subplots().scatter(*datasets[tuple(indices)], **kws, **STYLE)
 
 
 def check_figure_drawn(ui, indices):
     assert ui[indices]._drawn
 
 
-def _make_ui(level, pos):
+def _draw_callbacks_only(canvas):
+    # skip rendering the figure, but fire the draw event like `Figure.draw`
+    canvas.renderer = canvas.get_renderer()
+    DrawEvent('draw_event', canvas, canvas.renderer)._process()
+    canvas.figure.stale = False
+
+
+@pytest.fixture
+def no_render(monkeypatch):
+    # Tests that only check the draw bookkeeping don't need the pixels. See
+    # `test_delay_draw_rendered` for the same test with real rendering.
+    monkeypatch.setattr(FigureCanvasAgg, 'draw', _draw_callbacks_only)
+
+
+def _make_ui(level, pos, datasets):
     kls = MplTabs if level == 1 else MplMultiTab
     ui = kls(pos=pos)
 
     for kws in generate_features(level):
         ui.add_tab(*kws.values())
 
-    ui.add_task(_plot)        # add plot worker
+    ui.add_task(_plot, datasets)  # add plot worker
     ui.link_focus()               # keep same tab in focus across group switches
     ui.show()                     # this will trigger the first plot for [group 0, ...] tab 0
     return ui
@@ -164,9 +238,9 @@ def _make_ui(level, pos):
     'level, pos',
     ((i, ''.join(pos)) for i in range(1, 4) for pos in itt.product(*['NW'] * i))
 )
-def test_delay_draw(qtbot, level, pos, screenshot=False):
+def test_delay_draw(qtbot, no_render, datasets, level, pos, screenshot=False):
     #
-    ui = _make_ui(level, pos)
+    ui = _make_ui(level, pos, datasets[level])
 
     # register ui
     qtbot.addWidget(ui)
@@ -179,6 +253,103 @@ def test_delay_draw(qtbot, level, pos, screenshot=False):
     _test_cycle_tabs(qtbot, ui, check_figure_drawn)
 
 
+@pytest.mark.parametrize('pos', 'NW')
+def test_delay_draw_rendered(qtbot, datasets, pos):
+    # as above, with real Agg rendering for a single level
+    ui = _make_ui(1, pos, datasets[1])
+    qtbot.addWidget(ui)
+    _test_cycle_tabs(qtbot, ui, check_figure_drawn)
+
+
+# ---------------------------------------------------------------------------- #
+# Test closing tabs
+
+def test_close_tab(qtbot):
+    ui = MplTabs()
+    qtbot.addWidget(ui)
+    for name in 'ab':
+        ui.add_tab(name)
+    ui.show()
+
+    # close all tabs, including the one hosting the shared toolbar
+    for name in 'ab':
+        ui.tabs.close_tab(name)
+    assert len(ui.tabs) == 0
+
+    # process the deferred deletes
+    QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+
+    # new tabs should get a working toolbar
+    for name in 'cd':
+        ui.add_tab(name)
+    _change_tab(qtbot, ui.tabs, 1)
+    assert ui.tabs['d'].toolbar is ui.tabs._toolbar
+
+
+# ---------------------------------------------------------------------------- #
+# Test blitting animated artists
+
+def test_redraw_animated(qtbot):
+    ui = MplTabs()
+    qtbot.addWidget(ui)
+    tab = ui.add_tab('a')
+    line, = tab.figure.subplots().plot([0, 1], animated=True)
+    ui.show()
+    qtbot.waitExposed(ui)
+
+    # first call caches the background with the next full draw
+    tab.redraw_animated()
+    qtbot.waitUntil(lambda: tab._background is not None, timeout=1000)
+    assert tab._animated == [line]
+
+    # later calls blit the artists without a full draw
+    draws = []
+    tab.canvas.mpl_connect('draw_event', draws.append)
+    before = np.array(tab.canvas.buffer_rgba())
+    line.set_ydata([1, 0])
+    tab.redraw_animated()
+
+    assert not draws
+    assert (np.array(tab.canvas.buffer_rgba()) != before).any()
+
+
+# ---------------------------------------------------------------------------- #
+# Test saving
+
+@pytest.mark.parametrize(
+    'workers, singlecore, parallel',
+    ((1, None, False),
+     (2, None, True),
+     (2, '1', False),
+     (2, '0', True))
+)
+def test_save(qtbot, tmp_path, monkeypatch, workers, singlecore, parallel):
+    if singlecore is not None:
+        monkeypatch.setenv('MPL_MULTITAB_SINGLECORE', singlecore)
+
+    # record whether a process pool is used
+    pools = []
+
+    class Executor(futures.ProcessPoolExecutor):
+        def __init__(self, *args, **kws):
+            pools.append(self)
+            super().__init__(*args, **kws)
+
+    monkeypatch.setattr(futures, 'ProcessPoolExecutor', Executor)
+
+    ui = MplTabs()
+    qtbot.addWidget(ui)
+    for name in FEATURES['color']:
+        ui.add_tab(name).figure.subplots().plot([0, 1], color=name)
+
+    # template filenames, relative to folder
+    ui.tabs.save('{}.png', tmp_path, workers)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == \
+        sorted(f'{name}.png' for name in FEATURES['color'])
+    assert bool(pools) is parallel
+
+
 # if __name__ == '__main__':
 #     import sys
 #     from mpl_multitab import QtWidgets
@@ -186,6 +357,6 @@ def test_delay_draw(qtbot, level, pos, screenshot=False):
 #     app = QtWidgets.QApplication(sys.argv)
 #     # ui = example_nd()
 #     # ui = example_figures_predefined()
-#     ui = _make_ui(3, 'NWN')
+#     ui = _make_ui(3, 'NWN', _index_datasets(3))
 #     ui.show()
 #     sys.exit(app.exec_())
\ No newline at end of file